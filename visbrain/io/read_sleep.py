@@ -139,7 +139,7 @@ class ReadSleepData(object):
         # ========================== CHECKING ==========================
         # ---------- DATA ----------
         # Check data shape :
-        if data.ndim is not 2:
+        if data.ndim != 2:
             raise ValueError("The data must be a 2D array")
         nchan, npts = data.shape
 
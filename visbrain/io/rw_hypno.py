@@ -180,7 +180,7 @@ def write_hypno(filename, hypno, version='time', sf=100., npts=1, window=1.,
     # Extract file extension :
     _, ext = os.path.splitext(filename)
     # Switch between time and sample version :
-    if version is 'sample':  # v1 = sample
+    if version == 'sample':  # v1 = sample
         # Take a down-sample version of the hypno :
         step = int(len(hypno) / np.round(npts / sf))
         hypno = hypno[::step].astype(int)
@@ -189,7 +189,7 @@ def write_hypno(filename, hypno, version='time', sf=100., npts=1, window=1.,
             _write_hypno_txt_sample(filename, hypno, window=window)
         elif ext == '.hyp':
             _write_hypno_hyp_sample(filename, hypno, sf=sf, npts=npts)
-    elif version is 'time':  # v2 = time
+    elif version == 'time':  # v2 = time
         # Get the DataFrame :
         df = hypno_sample_to_time(hypno, time)
         if isinstance(info, dict):
@@ -1,29 +1,390 @@
 """Projection of a source object onto a brain object."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree, ConvexHull
 
 from ..utils import (normalize, color2vb)
 
 import logging
 logger = logging.getLogger('visbrain')
 PROJ_STR = "    %i sources visibles and not masked used for the %s"
+# Tiles of (vertex, source) distances. A tile of BLOCK_SIZE float32 (1MB)
+# stay in cache across the ufuncs applied on it :
+BLOCK_SIZE = 2 ** 18
+BLOCK_SOURCES = 1024
+# KD-trees are used to find sources under radius when the ball of radius
+# covers less than SPARSE_RATIO of the bounding box of the sources :
+SPARSE_RATIO = .01
+# The convex hull of the vertices is only used to compute the maximum
+# distance if, on a subsample of HULL_SAMPLE vertices, it keeps less than
+# HULL_RATIO of them (e.g not for spherical meshes) :
+HULL_SAMPLE = 2048
+HULL_RATIO = .1
+# Maximum number of threads used to process chunks of vertices :
+N_JOBS = min(3, os.cpu_count() or 1)
+
+
+def _euclidian_distance(v, xyz, xyz_sq=None, squared=False, out=None):
+    """Euclidian distance between vertices and sources.
+
+    The squared distance is decomposed into |v|² + |xyz|² - 2 * v.xyz so
+    that the expensive part is a single matrix product (BLAS).
+
+    Parameters
+    ----------
+    v : array_like
+        Array of vertices of shape (nv, 3).
+    xyz : array_like
+        Array of source's coordinates of shape (3, n_sources).
+    xyz_sq : array_like | None
+        Precomputed squared norm of the sources of shape (n_sources,).
+    squared : bool | False
+        Return the squared euclidian distance. Note that in that case, small
+        negative values can be returned because of rounding errors.
+    out : array_like | None
+        Preallocated float32 array of shape (nv, n_sources) where distances
+        are written.
+
+    Returns
+    -------
+    eucl : array_like
+        The euclidian distance of shape (nv, n_sources).
+    """
+    if xyz_sq is None:
+        xyz_sq = np.einsum('ij,ij->j', xyz, xyz)
+    v_sq = np.einsum('ij,ij->i', v, v)
+    eucl = np.dot(v, xyz, out=out)
+    np.multiply(eucl, -2., out=eucl)
+    np.add(eucl, v_sq.reshape(-1, 1), out=eucl)
+    np.add(eucl, xyz_sq.reshape(1, -1), out=eucl)
+    if squared:
+        return eucl
+    # Rounding errors can lead to small negative values :
+    np.maximum(eucl, 0., out=eucl)
+    return np.sqrt(eucl, out=eucl)
+
+
+def _block_steps(v, n_sources):
+    """Get the number of vertices and sources per tile."""
+    index_faced = v.shape[1]
+    s_step = max(min(n_sources, BLOCK_SOURCES), 1)
+    v_step = max(BLOCK_SIZE // (index_faced * s_step), 1)
+    return v_step, s_step
+
+
+def _blocks(v, n_sources):
+    """Split the (vertex, source) pairs into tiles of BLOCK_SIZE distances.
+
+    Parameters
+    ----------
+    v : array_like
+        The vertices of shape (nv, index_faced, 3).
+    n_sources : int
+        Number of sources.
+
+    Returns
+    -------
+    blocks : generator
+        Generator of (vertices, sources) slices. For a given slice of
+        vertices, every slice of sources is returned before moving to the
+        next vertices.
+    """
+    nv = v.shape[0]
+    v_step, s_step = _block_steps(v, n_sources)
+    for v_start in range(0, nv, v_step):
+        sl_v = slice(v_start, min(v_start + v_step, nv))
+        for s_start in range(0, n_sources, s_step):
+            yield sl_v, slice(s_start, min(s_start + s_step, n_sources))
+
+
+def _tile_buffers(v, n_sources):
+    """Allocate the buffers of distances and mask shared by every tile.
+
+    Parameters
+    ----------
+    v : array_like
+        The vertices of shape (nv, index_faced, 3).
+    n_sources : int
+        Number of sources.
+
+    Returns
+    -------
+    buffers : tuple
+        Flat float32 and boolean buffers large enough for the biggest tile.
+    """
+    v_step, s_step = _block_steps(v, n_sources)
+    size = min(v.shape[0], v_step) * v.shape[1] * min(n_sources, s_step)
+    return np.empty((size,), dtype=np.float32), np.empty((size,), dtype=bool)
 
 
-def _get_eucl_mask(v, xyz, radius, contribute, xsign):
-    # Compute euclidian distance and get sources under radius :
-    eucl = cdist(v, xyz)
-    eucl = eucl.astype(np.float32, copy=False)
-    mask = eucl <= radius
+def _map_vertices(fcn, v, n_sources):
+    """Apply a function on contiguous chunks of vertices using threads.
+
+    NumPy ufuncs and BLAS products release the GIL so that chunks of
+    vertices are effectively processed in parallel.
+
+    Parameters
+    ----------
+    fcn : function
+        Function taking a slice of vertices as input.
+    v : array_like
+        The vertices of shape (nv, index_faced, 3).
+    n_sources : int
+        Number of sources.
+
+    Returns
+    -------
+    results : list
+        List of the outputs of fcn for each chunk of vertices.
+    """
+    nv = v.shape[0]
+    # Only split the vertices if each chunk has at least one tile :
+    n_tiles = -(-nv * v.shape[1] * n_sources // BLOCK_SIZE)
+    n_jobs = max(min(N_JOBS, n_tiles, nv), 1)
+    step = -(-nv // n_jobs)
+    chunks = [slice(k, min(k + step, nv)) for k in range(0, nv, step)]
+    if len(chunks) == 1:
+        return [fcn(chunks[0])]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        return list(executor.map(fcn, chunks))
+
+
+def _get_eucl_mask(v, xyz, radius, contribute, vsign, xsign, xyz_sq=None,
+                   buffers=None):
+    nv, index_faced, n_sources = v.shape[0], v.shape[1], xyz.shape[1]
+    # Reuse preallocated buffers (see _tile_buffers) rather than allocating
+    # new distances and mask for each tile :
+    eucl_buf = mask_buf = None
+    if buffers is not None:
+        size = nv * index_faced * n_sources
+        eucl_buf = buffers[0][:size].reshape(nv * index_faced, n_sources)
+        mask_buf = buffers[1][:size].reshape(nv, index_faced, n_sources)
+    # Compute euclidian distance of every faced vertices in a single product :
+    eucl = _euclidian_distance(v.reshape(nv * index_faced, 3), xyz, xyz_sq,
+                               out=eucl_buf)
+    eucl = eucl.reshape(nv, index_faced, n_sources)
+    # Get sources under radius :
+    mask = np.less_equal(eucl, radius, out=mask_buf)
     # Contribute :
     if not contribute:
-        # Get vertices sign :
-        vsign = np.sign(v[:, 0]).reshape(-1, 1)
-        # Find where vsign and xsign are equals :
-        isign = np.logical_and(vsign != xsign, xsign != 0)
-        mask[isign] = False
+        # Only keep sources in the same hemisphere as the vertex (or sources
+        # that are on the midline) :
+        keep = np.equal(vsign, xsign)
+        np.logical_or(keep, xsign == 0, out=keep)
+        np.logical_and(mask, keep, out=mask)
     return eucl, mask
 
 
+def _is_sparse(xyz, radius):
+    """Estimate if only a small fraction of the sources are under radius.
+
+    Parameters
+    ----------
+    xyz : array_like
+        The source's coordinates of shape (3, n_sources).
+    radius : float
+        The radius under which activity is projected on vertices.
+
+    Returns
+    -------
+    is_sparse : bool
+        True if KD-trees should be used to find sources under radius.
+    """
+    extent = np.maximum(np.ptp(xyz, axis=1), 2. * radius)
+    ball = 4. * np.pi * radius ** 3 / 3.
+    return bool(ball / np.prod(extent) < SPARSE_RATIO)
+
+
+def _get_eucl_pairs(v, xyz, radius, contribute, vsign, xsign):
+    """Iterate over the (faced vertex, source) pairs under radius.
+
+    Only the distances under radius are computed using KD-trees.
+
+    Parameters
+    ----------
+    v : array_like
+        The vertices of shape (nv, index_faced, 3).
+    xyz : array_like
+        The source's coordinates of shape (3, n_sources).
+    radius : float
+        The radius under which activity is projected on vertices.
+    contribute: bool
+        Specify if sources contribute on both hemisphere.
+    vsign : array_like
+        Sign of the x coordinate of the vertices, of shape
+        (nv, index_faced, 1).
+    xsign : array_like
+        Sign of the x coordinate of the sources, of shape (1, n_sources).
+
+    Returns
+    -------
+    pairs : generator
+        Generator of (i, s, eucl) arrays where i is the index of the faced
+        vertex (i.e in the flattened (nv * index_faced) vertices), s the
+        index of the source and eucl the euclidian distance between them.
+    """
+    v = v.reshape(-1, 3)
+    vsign, xsign = vsign.ravel(), xsign.ravel()
+    s_tree = cKDTree(xyz.T)
+    # Number of faced vertices per chunk (about BLOCK_SIZE expected pairs) :
+    step = max(int(BLOCK_SIZE / max(xyz.shape[1] * SPARSE_RATIO, 1.)), 1)
+    for start in range(0, len(v), step):
+        v_tree = cKDTree(v[start:start + step, :])
+        pairs = v_tree.sparse_distance_matrix(s_tree, radius,
+                                              output_type='ndarray')
+        i, s = pairs['i'] + start, pairs['j']
+        eucl = pairs['v'].astype(np.float32)
+        # Contribute :
+        if not contribute:
+            xs = xsign[s]
+            keep = np.logical_or(vsign[i] == xs, xs == 0)
+            i, s, eucl = i[keep], s[keep], eucl[keep]
+        yield i, s, eucl
+
+
+def _hull_vertices(v):
+    """Get the vertices of the convex hull when it removes most of them.
+
+    Parameters
+    ----------
+    v : array_like
+        The vertices of shape (nv, 3).
+
+    Returns
+    -------
+    v : array_like
+        The vertices of the convex hull or the input vertices.
+    """
+    try:
+        step = max(len(v) // HULL_SAMPLE, 1)
+        hull = ConvexHull(v[::step, :]).vertices
+        if len(hull) > HULL_RATIO * len(v[::step, :]):
+            return v  # the hull is expensive and keeps most of the vertices
+        return v[hull if step == 1 else ConvexHull(v).vertices, :]
+    except Exception:  # not enough vertices or coplanar vertices
+        return v
+
+
+def _max_distance(v, xyz, xyz_sq=None):
+    """Get the maximum distance between faced vertices and sources.
+
+    The distance to a source being convex, this maximum is reached on the
+    vertices of the convex hull which is used, when it is small enough, to
+    reduce the computations.
+
+    Parameters
+    ----------
+    v : array_like
+        The vertices of shape (nv, index_faced, 3).
+    xyz : array_like
+        The source's coordinates of shape (3, n_sources).
+    xyz_sq : array_like | None
+        Precomputed squared norm of the sources of shape (n_sources,).
+
+    Returns
+    -------
+    emax : array_like
+        The maximum distance per faced vertex of shape (index_faced,).
+    """
+    if xyz_sq is None:
+        xyz_sq = np.einsum('ij,ij->j', xyz, xyz)
+    index_faced = v.shape[1]
+    # Running maximum of the squared distances (the square root is only
+    # taken on the final maximum) :
+    emax = np.zeros((index_faced,), dtype=np.float32)
+    for k in range(index_faced):
+        v_k = np.ascontiguousarray(_hull_vertices(v[:, k, :]))
+        v_k = v_k[:, np.newaxis, :]
+        for sl, ss in _blocks(v_k, xyz.shape[1]):
+            eucl = _euclidian_distance(v_k[sl, 0, :], xyz[:, ss], xyz_sq[ss],
+                                       squared=True)
+            emax[k] = max(emax[k], eucl.max())
+    return np.sqrt(emax, out=emax)
+
+
+def _modulation_kernel(v, xyz, data, vsign, xsign, radius, contribute,
+                       modulation, prop, used):
+    """Compute the weighted sum of source's data under radius (inplace).
+
+    Parameters
+    ----------
+    v : array_like
+        The vertices of shape (nv, index_faced, 3).
+    xyz : array_like
+        The source's coordinates of shape (3, n_sources).
+    data : array_like
+        The source's data of shape (n_sources,).
+    vsign : array_like
+        Sign of the x coordinate of the vertices, of shape
+        (nv, index_faced, 1).
+    xsign : array_like
+        Sign of the x coordinate of the sources, of shape (1, n_sources).
+    radius : float
+        The radius under which activity is projected on vertices.
+    contribute: bool
+        Specify if sources contribute on both hemisphere.
+    modulation : array_like
+        Output weighted sum of shape (nv, index_faced).
+    prop : array_like
+        Output number of contributing sources of shape (nv, index_faced).
+    used : array_like
+        Output boolean array of shape (n_sources,) where sources under the
+        radius of at least one vertex are set to True.
+    """
+    nv, index_faced = v.shape[0], v.shape[1]
+    xyz_sq = np.einsum('ij,ij->j', xyz, xyz)
+    # Maximum distance per faced vertex used to invert distances. Inverted
+    # distances 1 - eucl / emax are computed as (emax - eucl) / emax where
+    # the division is factored out of the sum over sources :
+    emax = _max_distance(v, xyz, xyz_sq)
+    if _is_sparse(xyz, radius):
+        # Only use the (faced vertex, source) pairs under radius :
+        for i, s, eucl in _get_eucl_pairs(v, xyz, radius, contribute, vsign,
+                                          xsign):
+            w = (emax[i % index_faced] - eucl) * data[s]
+            modulation += np.bincount(i, w, nv * index_faced).reshape(
+                nv, index_faced)
+            prop += np.bincount(i, minlength=nv * index_faced).reshape(
+                nv, index_faced)
+            used[s] = True
+        np.divide(modulation, emax, out=modulation)
+        return
+    # The (nv, index_faced, n_sources) distances are never stored entirely
+    # but computed over tiles. Chunks of vertices write into disjoint rows
+    # of the outputs and can run in parallel threads :
+    emax_t = emax.reshape(1, -1, 1)
+
+    def _modulation_tiles(sl_v):
+        v_c, vsign_c = v[sl_v], vsign[sl_v]
+        mod_c, prop_c = modulation[sl_v], prop[sl_v]
+        used_c = np.zeros_like(used)
+        buffers = _tile_buffers(v_c, xyz.shape[1])
+        for sl, ss in _blocks(v_c, xyz.shape[1]):
+            eucl, mask = _get_eucl_mask(v_c[sl], xyz[:, ss], radius,
+                                        contribute, vsign_c[sl],
+                                        xsign[:, ss], xyz_sq[ss], buffers)
+            # Invert euclidian distance and zero sources over radius :
+            np.subtract(emax_t, eucl, out=eucl)
+            np.multiply(eucl, mask, out=eucl)
+            # Modulate data by distance and get the number of contributing
+            # sources per vertex. The first tile of sources directly write
+            # into the outputs while the next ones are accumulated :
+            if ss.start == 0:
+                np.dot(eucl, data[ss], out=mod_c[sl])
+                np.sum(mask, axis=2, dtype=np.float32, out=prop_c[sl])
+            else:
+                mod_c[sl] += np.dot(eucl, data[ss])
+                prop_c[sl] += np.sum(mask, axis=2, dtype=np.float32)
+            used_c[ss] |= mask.any(axis=(0, 1))
+        return used_c
+
+    for used_c in _map_vertices(_modulation_tiles, v, xyz.shape[1]):
+        used |= used_c
+    np.divide(modulation, emax, out=modulation)
+
+
 def _check_projection(s_obj, v, radius, contribute, not_masked=True):
     # =============== CHECKING ===============
     assert isinstance(v, np.ndarray)
@@ -38,10 +399,18 @@ def _check_projection(s_obj, v, radius, contribute, not_masked=True):
     else:           # get visible and masked sources
         mask = np.logical_and(s_obj.mask, s_obj.visible)
     xyz, data = s_obj._xyz[mask, :], s_obj._data[mask]
+    # Sources are stored as (3, n_sources) so that each coordinate is
+    # contiguous :
+    xyz = np.ascontiguousarray(xyz.T, dtype=np.float32)
+    data = data.astype(np.float32, copy=False)
+    if not len(data):  # nothing to project, only the shape of v is used
+        return xyz, data, v, None, None
+    v = v.astype(np.float32, copy=False)
     # Get sign of the x coordinate :
-    xsign = np.sign(xyz[:, 0]).reshape(1, -1)
+    vsign = np.sign(v[:, :, [0]])
+    xsign = np.sign(xyz[[0], :])
 
-    return xyz, data, v, xsign
+    return xyz, data, v, vsign, xsign
 
 
 def _project_modulation(s_obj, v, radius, contribute=False):
@@ -66,42 +435,31 @@ def _project_modulation(s_obj, v, radius, contribute=False):
         radius.
     """
     # Check inputs :
-    xyz, data, v, xsign = _check_projection(s_obj, v, radius, contribute)
+    xyz, data, v, vsign, xsign = _check_projection(s_obj, v, radius,
+                                                   contribute)
     logger.info(PROJ_STR % (len(data), 'projection'))
     index_faced = v.shape[1]
-    # Modulation / proportion / (Min, Max) :
-    modulation = np.ma.zeros((v.shape[0], index_faced), dtype=np.float32)
-    prop = np.zeros_like(modulation.data)
-    minmax = np.zeros((index_faced, 2), dtype=np.float32)
+    # Modulation / proportion / contributing sources :
+    modulation = np.zeros((v.shape[0], index_faced), dtype=np.float32)
     if len(data) == 0:
         logger.warn("Projection ignored because no sources visibles and "
                     "not masked")
         return np.squeeze(np.ma.masked_array(modulation, True))
+    prop = np.zeros_like(modulation)
+    used = np.zeros((len(data),), dtype=bool)
 
-    # For each triangle :
-    for k in range(index_faced):
-        # =============== EUCLIDIAN DISTANCE ===============
-        eucl, mask = _get_eucl_mask(v[:, k, :], xyz, radius, contribute, xsign)
-        # Invert euclidian distance for modulation and mask it :
-        np.multiply(eucl, -1. / eucl.max(), out=eucl)
-        np.add(eucl, 1., out=eucl)
-        eucl = np.ma.masked_array(eucl, mask=np.invert(mask),
-                                  dtype=np.float32)
-
-        # =============== MODULATION ===============
-        # Modulate data by distance (only for sources under radius) :
-        modulation[:, k] = np.ma.dot(eucl, data, strict=False)
-
-        # =============== PROPORTIONS ===============
-        np.sum(mask, axis=1, dtype=np.float32, out=prop[:, k])
-        nnz = np.nonzero(mask.sum(0))
-        minmax[k, :] = np.array([data[nnz].min(), data[nnz].max()])
+    # =============== MODULATION ===============
+    _modulation_kernel(v, xyz, data, vsign, xsign, radius, contribute,
+                       modulation, prop, used)
+    minmax = (data[used].min(), data[used].max())
 
+    # Vertices without any source under radius are masked :
+    mod_mask = prop == 0.
     # Divide modulations by the number of contributing sources :
-    prop[prop == 0.] = 1.
-    np.divide(modulation, prop, out=modulation)
+    np.divide(modulation, prop, out=modulation, where=~mod_mask)
+    modulation = np.ma.masked_array(modulation, mask=mod_mask)
     # Normalize inplace modulations between under radius data :
-    normalize(modulation, minmax.min(), minmax.max())
+    normalize(modulation, *minmax)
     s_obj._minmax = (modulation.min(), modulation.max())
 
     return np.squeeze(modulation)
@@ -129,26 +487,38 @@ def _project_repartition(s_obj, v, radius, contribute=False):
         radius.
     """
     # Check inputs :
-    xyz, _, v, xsign = _check_projection(s_obj, v, radius, contribute)
-    logger.info(PROJ_STR % (xyz.shape[0], 'repartition'))
+    xyz, _, v, vsign, xsign = _check_projection(s_obj, v, radius,
+                                                contribute)
+    logger.info(PROJ_STR % (xyz.shape[1], 'repartition'))
     index_faced = v.shape[1]
     # Corticale repartition :
-    repartition = np.ma.zeros((v.shape[0], index_faced), dtype=np.int)
+    repartition = np.zeros((v.shape[0], index_faced), dtype=np.int32)
     if not xyz.size:
         logger.warn("Repartition ignored because no sources visibles and "
                     "not masked")
         return np.squeeze(np.ma.masked_array(repartition, True))
 
-    # For each triangle :
-    for k in range(index_faced):
-        # =============== EUCLIDIAN DISTANCE ===============
-        eucl, mask = _get_eucl_mask(v[:, k, :], xyz, radius, contribute, xsign)
-
-        # =============== REPARTITION ===============
-        # Sum over sources dimension :
-        sm = np.sum(mask, 1, dtype=np.int)
-        smmask = np.invert(sm.astype(bool))
-        repartition[:, k] = np.ma.masked_array(sm, mask=smmask)
+    # =============== REPARTITION ===============
+    # Sum over sources dimension and mask vertices without sources :
+    if _is_sparse(xyz, radius):
+        rep = repartition.reshape(-1)
+        for i, _, _ in _get_eucl_pairs(v, xyz, radius, contribute, vsign,
+                                       xsign):
+            rep += np.bincount(i, minlength=len(rep))
+    else:
+        xyz_sq = np.einsum('ij,ij->j', xyz, xyz)
+
+        def _repartition_tiles(sl_v):
+            v_c, vsign_c, rep_c = v[sl_v], vsign[sl_v], repartition[sl_v]
+            buffers = _tile_buffers(v_c, xyz.shape[1])
+            for sl, ss in _blocks(v_c, xyz.shape[1]):
+                _, mask = _get_eucl_mask(v_c[sl], xyz[:, ss], radius,
+                                         contribute, vsign_c[sl],
+                                         xsign[:, ss], xyz_sq[ss], buffers)
+                rep_c[sl] += np.sum(mask, 2, dtype=np.int32)
+
+        _map_vertices(_repartition_tiles, v, xyz.shape[1])
+    repartition = np.ma.masked_array(repartition, mask=repartition == 0)
     s_obj._minmax = (repartition.min(), repartition.max())
 
     return np.squeeze(repartition)
@@ -174,23 +544,33 @@ def _get_masked_index(s_obj, v, radius, contribute=False):
         The repartition of shape (nv, 3) or (nv, 3, 3) if index faced.
     """
     # Check inputs and get masked xyz / data :
-    xyz, data, v, xsign = _check_projection(s_obj, v, radius, contribute,
-                                            False)
+    xyz, data, v, vsign, xsign = _check_projection(s_obj, v, radius,
+                                                   contribute, False)
     logger.info("    %i sources visibles and masked found" % len(data))
-    # Predefined masked euclidian distance :
     nv, index_faced = v.shape[0], v.shape[1]
-    fmask = np.ones((v.shape[0], index_faced, len(data)), dtype=bool)
 
-    # For each triangle :
-    for k in range(index_faced):
-        # =============== EUCLIDIAN DISTANCE ===============
-        _, fmask[:, k, :] = _get_eucl_mask(v[:, k, :], xyz, radius, contribute,
-                                           xsign)
     # Find where there's sources under radius and need to be masked :
-    m = fmask.reshape(fmask.shape[0] * index_faced, fmask.shape[2])
-    idx = np.dot(m, np.ones((len(data),), dtype=bool))
-
-    return np.squeeze(idx.reshape(nv, index_faced))
+    idx = np.zeros((nv, index_faced), dtype=bool)
+    if not xyz.size:
+        return np.squeeze(idx)
+    elif _is_sparse(xyz, radius):
+        for i, _, _ in _get_eucl_pairs(v, xyz, radius, contribute, vsign,
+                                       xsign):
+            idx.reshape(-1)[i] = True
+        return np.squeeze(idx)
+    xyz_sq = np.einsum('ij,ij->j', xyz, xyz)
+    buffers = _tile_buffers(v, xyz.shape[1])
+    for sl, ss in _blocks(v, xyz.shape[1]):
+        # Skip vertices that already have a masked source under radius :
+        rows = np.flatnonzero(~idx[sl].all(1)) + sl.start
+        if not rows.size:
+            continue
+        _, mask = _get_eucl_mask(v[rows], xyz[:, ss], radius, contribute,
+                                 vsign[rows], xsign[:, ss], xyz_sq[ss],
+                                 buffers)
+        idx[rows] |= mask.any(2)
+
+    return np.squeeze(idx)
 
 
 def _project_sources_data(s_obj, b_obj, project='modulation', radius=10.,
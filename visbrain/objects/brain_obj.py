@@ -666,8 +666,12 @@ class BrainObj(VisbrainObject):
         if hemi == 'both':
             return arr
         elif hemi in ['left', 'right']:
-            lr = mesh._lr_index if hemi == 'left' else ~mesh._lr_index
-            lr = mesh._lr_index[mesh._faces[:, 0]] if indexed_faces else lr
+            if indexed_faces:  # same rule as the drawn faces (BrainVisual)
+                lr_faces = mesh._lr_index[mesh._faces]
+                is_left = hemi == 'left'
+                lr = lr_faces.all(1) if is_left else ~lr_faces.any(1)
+            else:
+                lr = mesh._lr_index if hemi == 'left' else ~mesh._lr_index
             return arr[lr, ...]
 
     # ----------- VERTICES -----------
@@ -1,5 +1,6 @@
 """Base class for objects of type source."""
 from warnings import warn
+from functools import lru_cache
 import logging
 import numpy as np
 from itertools import product
@@ -14,12 +15,43 @@ from ._projection import _project_sources_data
 from .roi_obj import RoiObj
 from ..utils import (tal2mni, color2vb, normalize, vispy_array,
                      wrap_properties, array2colormap)
+from ..utils.color import _color2rgb
 
 
 logger = logging.getLogger('visbrain')
 PROJ_STR = "%i sources visibles and not masked used for the %s"
 
 
+@lru_cache(maxsize=256)
+def _color2vb_cached(color, alpha):
+    return color2vb(color, alpha=alpha)
+
+
+def _color2vb(color, length=1, alpha=1.):
+    """Same as color2vb but cache the conversion of strings and tuples.
+
+    Parameters
+    ----------
+    color : None/tuple/string | None
+        The color to use (see color2vb).
+    length : int | 1
+        The length of the output array.
+    alpha : float | 1
+        The opacity.
+
+    Returns
+    -------
+    vcolor : array_like
+        Array of RGBA colors of shape (length, 4).
+    """
+    if isinstance(color, (str, tuple)):
+        try:
+            return np.repeat(_color2vb_cached(color, alpha), length, axis=0)
+        except TypeError:  # tuple of unhashable elements
+            pass
+    return color2vb(color, length=length, alpha=alpha)
+
+
 class SourceObj(VisbrainObject):
     """Create a source object.
 
@@ -154,7 +186,7 @@ class SourceObj(VisbrainObject):
             mask = [False] * len(self)
         self._mask = np.asarray(mask).ravel().astype(bool)
         assert len(self._mask) == len(self)
-        self._mask_color = color2vb(mask_color)
+        self._mask_color = _color2vb(mask_color)
         # Text :
         self._text_size = text_size
         self._text_color = text_color
@@ -175,7 +207,7 @@ class SourceObj(VisbrainObject):
         assert len(self._text) == len(self)
         self._sources_text = visuals.Text(self._text, pos=self._xyz,
                                           bold=text_bold, name='Text',
-                                          color=color2vb(text_color),
+                                          color=_color2vb(text_color),
                                           font_size=text_size,
                                           parent=self._node)
         self._sources_text.visible = not tvisible
@@ -256,10 +288,22 @@ class SourceObj(VisbrainObject):
         """Update marker's color."""
         # Get marker's background color :
         if isinstance(self._color, str):   # color='white'
-            bg_color = color2vb(self._color, length=len(self))
+            bg_color = _color2vb(self._color, length=len(self))
         elif isinstance(self._color, list):  # color=['white', 'green']
             assert len(self._color) == len(self)
-            bg_color = np.squeeze(np.array([color2vb(k) for k in self._color]))
+            # Each unique color is converted once and then gathered :
+            if all(isinstance(k, str) for k in self._color):
+                u_color, inverse = np.unique(self._color, return_inverse=True)
+                u_color = u_color.tolist()
+            else:
+                keys = [k if isinstance(k, str) or k is None else tuple(
+                    np.ravel(k)) for k in self._color]
+                u_index = {}
+                inverse = np.array([u_index.setdefault(k, len(u_index))
+                                    for k in keys])
+                u_color = list(u_index)
+            u_rgba = [list(c) + [a] for c, a in map(_color2rgb, u_color)]
+            bg_color = np.array(u_rgba, dtype=np.float32)[inverse.ravel()]
         elif isinstance(self._color, np.ndarray):  # color = [[0, 0, 0], ...]
             csh = self._color.shape
             assert (csh[0] == len(self)) and (csh[1] >= 3)
@@ -267,8 +311,10 @@ class SourceObj(VisbrainObject):
                 self._color = np.c_[self._color, np.full(len(self),
                                                          self._alpha)]
             bg_color = self._color.copy()
+        bg_color = np.ascontiguousarray(bg_color, dtype=np.float32)
+        bg_color = bg_color.reshape(-1, 4)
         # Update masked marker's color :
-        bg_color[self._mask, :] = self._mask_color
+        np.copyto(bg_color, self._mask_color, where=self._mask.reshape(-1, 1))
         self._sources._data['a_bg_color'] = bg_color
         self.update()
 
@@ -611,7 +657,8 @@ class SourceObj(VisbrainObject):
     @property
     def visible_and_not_masked(self):
         """Get the visible_and_not_masked value."""
-        return np.logical_and(self._visible, ~self.mask)
+        # Not cached : mask and visible can be modified inplace
+        return np.logical_and(self._visible, ~self._mask)
 
     # ----------- RADIUSMIN -----------
     @property
@@ -680,7 +727,7 @@ class SourceObj(VisbrainObject):
     @wrap_properties
     def edge_color(self, value):
         """Set edge_color value."""
-        color = color2vb(value, alpha=self.alpha)
+        color = _color2vb(value, alpha=self.alpha)
         self._sources._data['a_fg_color'] = color
         self._edge_color = color
         self.update()
@@ -733,7 +780,7 @@ class SourceObj(VisbrainObject):
     @property
     def is_masked(self):
         """Get the is_masked value."""
-        return any(self._mask)
+        return bool(np.any(self._mask))
 
     # ----------- MASKCOLOR -----------
     @property
@@ -745,7 +792,7 @@ class SourceObj(VisbrainObject):
     @wrap_properties
     def mask_color(self, value):
         """Set mask_color value."""
-        self._mask_color = color2vb(value)
+        self._mask_color = _color2vb(value)
         self._update_color()
 
     # ----------- VISIBLE -----------
@@ -796,7 +843,7 @@ class SourceObj(VisbrainObject):
     @wrap_properties
     def text_color(self, value):
         """Set text_color value."""
-        color = color2vb(value)
+        color = _color2vb(value)
         self._sources_text.color = color
         self._text_color = color
         self._sources_text.update()
@@ -1,9 +1,11 @@
 """Test BrainObj."""
 import numpy as np
+import pytest
 
 from visbrain.objects import BrainObj, SourceObj
 from visbrain.objects.tests._testing_objects import _TestObjects
 from visbrain.io import read_stc, clean_tmp
+from visbrain.visuals.brain_visual import MAX_OVERLAYS
 
 
 NEEDED_FILES = dict(ANNOT_FILE_1='lh.aparc.annot',
@@ -145,6 +147,36 @@ class TestBrainObj(_TestObjects):
             assert b_obj.vertices.shape[0] < n_vertices_both
             assert b_obj.faces.shape[0] < n_faces_both
             assert b_obj.normals.shape[0] < n_normals_both
+            # Returned faces are the drawn ones :
+            n_drawn = len(b_obj.mesh._hemi_faces[k][0])
+            assert b_obj.faces.shape[0] == n_drawn
+
+    def test_mesh_builtin_methods(self):
+        """Test len, iteration and indexing of the mesh vertices."""
+        mesh = b_obj.mesh
+        assert len(mesh) == mesh._vertices.shape[0]
+        assert len(list(mesh)) == len(mesh)
+        np.testing.assert_array_equal(mesh[0], mesh._vertices[0])
+        np.testing.assert_array_equal(mesh[[1, 2]], mesh._vertices[[1, 2]])
+
+    def test_max_overlays(self):
+        """Test that the number of overlays is limited."""
+        data = np.random.rand(len(b_obj.mesh))
+        with pytest.raises(ValueError):
+            b_obj.mesh.add_overlay(data, to_overlay=MAX_OVERLAYS)
+
+    def test_sulcus(self):
+        """Test setting the sulcus of the mesh."""
+        b_sulc = BrainObj('Custom', vertices=vertices, faces=faces)
+        sulcus = np.zeros((len(b_sulc.mesh),), dtype=bool)
+        sulcus[::3] = True
+        b_sulc.mesh.sulcus = sulcus
+        bgd_data = b_sulc.mesh._bgd_data
+        assert np.all(bgd_data[sulcus] == 2)  # sulcus color index
+        assert np.all(bgd_data[~sulcus] == 0)  # default color index
+        # Non boolean arrays are rejected :
+        with pytest.raises(AssertionError):
+            b_sulc.mesh.sulcus = sulcus.astype(int)
 
     def test_clean(self):
         """Test function clean."""
@@ -0,0 +1,60 @@
+"""Test the projection of sources onto vertices."""
+import numpy as np
+
+from visbrain.objects import SourceObj
+from visbrain.objects import _projection
+from visbrain.objects._projection import (_project_modulation,
+                                          _project_repartition,
+                                          _get_masked_index, _hull_vertices,
+                                          _max_distance)
+
+
+# Vertices on a sphere and sources around it :
+rnd = np.random.RandomState(0)
+vertices = rnd.normal(size=(2000, 3))
+vertices *= 50. / np.linalg.norm(vertices, axis=1, keepdims=True)
+xyz = rnd.uniform(-55., 55., (60, 3))
+data = rnd.rand(60)
+mask = data > .7
+s_obj = SourceObj('S', xyz, data=data, mask=mask)
+
+
+class TestProjection(object):
+    """Test the sparse (KD-tree) and dense projection paths."""
+
+    @staticmethod
+    def _project(monkeypatch, ratio, radius, contribute):
+        monkeypatch.setattr(_projection, 'SPARSE_RATIO', ratio)
+        return [fcn(s_obj, vertices, radius, contribute) for fcn in (
+            _project_modulation, _project_repartition, _get_masked_index)]
+
+    def test_sparse_dense(self, monkeypatch):
+        """Test that the sparse and dense paths give the same results."""
+        for radius in [5., 10., 30.]:
+            for contribute in [False, True]:
+                dense = self._project(monkeypatch, 0., radius, contribute)
+                sparse = self._project(monkeypatch, np.inf, radius,
+                                       contribute)
+                for d, s in zip(dense[0:2], sparse[0:2]):
+                    np.testing.assert_array_equal(np.ma.getmaskarray(d),
+                                                  np.ma.getmaskarray(s))
+                    np.testing.assert_allclose(np.ma.getdata(d),
+                                               np.ma.getdata(s), atol=1e-5)
+                np.testing.assert_array_equal(dense[2], sparse[2])
+                assert dense[2].any()
+
+    def test_max_distance(self):
+        """Test the maximum distance and the convex hull guard."""
+        from scipy.spatial.distance import cdist
+        from vispy.geometry import create_sphere
+        sphere = create_sphere(100, 100, radius=50.).get_vertices()
+        blob = rnd.normal(size=(10000, 3)) * 30.
+        # The hull is skipped on a sphere (every vertex is on it) :
+        assert len(_hull_vertices(sphere)) == len(sphere)
+        assert len(_hull_vertices(blob)) < .1 * len(blob)
+        for v in [sphere, blob]:
+            v = v.astype(np.float32)
+            xyz_t = np.ascontiguousarray(xyz.T, dtype=np.float32)
+            emax = _max_distance(v[:, np.newaxis, :], xyz_t)
+            np.testing.assert_allclose(emax[0], cdist(v, xyz).max(),
+                                       rtol=1e-5)
@@ -68,6 +68,13 @@ class TestSourceObj(_TestObjects):
         mask_color = np.array([0.] * 4).astype(np.float32)
         self.assert_and_test('mask_color', mask_color)
         self.assert_and_test('visible', new_mask)
+        assert not np.any(s_obj.visible_and_not_masked)
+        # Inplace modifications of the mask and of the visibility :
+        s_vnm = SourceObj('S', s_xyz)
+        s_vnm.mask[0] = True
+        s_vnm.visible[1] = False
+        assert not np.any(s_vnm.visible_and_not_masked[0:2])
+        assert np.all(s_vnm.visible_and_not_masked[2:])
         np.testing.assert_array_equal(s_obj.hide, np.invert(new_mask))
         self.assert_and_test('text_size', 10.)
         text_color = np.array([.5] * 4).astype(np.float32)
@@ -102,6 +109,14 @@ class TestSourceObj(_TestObjects):
                             roi_to_color={'White': 'red', 'Gray': 'green'},
                             hide_others=True)
 
+    def test_list_of_colors(self):
+        """Test that a list of colors matches the single color case."""
+        for color in ['red', '#ab4642', 'not_a_color']:
+            s_1 = SourceObj('S', s_xyz, color=color)
+            s_2 = SourceObj('S', s_xyz, color=[color] * n_sources)
+            np.testing.assert_array_equal(s_1._sources._data['a_bg_color'],
+                                          s_2._sources._data['a_bg_color'])
+
     def test_set_visible_sources(self):
         """Test function select_sources."""
         to_test = ['inside', 'outside', 'close', 'none', 'left', 'right',
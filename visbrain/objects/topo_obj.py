@@ -489,7 +489,7 @@ class TopoObj(VisbrainObject):
         """
         # Get theta / phi :
         theta, phi = xyz[:, 0], xyz[:, 1]
-        if unit is 'degree':
+        if unit == 'degree':
             np.deg2rad(theta, out=theta)
             np.deg2rad(phi, out=phi)
         # Get radius :
@@ -182,6 +182,42 @@ class Colormap(object):
         return self._data[:, -1]
 
 
+def _color2rgb(color=None, default=(1., 1., 1.), alpha=1.0):
+    """Get the RGB tuple and the opacity of a single color (see color2vb).
+
+    Returns
+    -------
+    coltuple : tuple
+        The (R, G, B) color.
+    alpha : float
+        The opacity.
+    """
+    if color is None:  # Default
+        coltuple = default
+    elif isinstance(color, (tuple, list, np.ndarray)):  # Static
+        color = np.squeeze(color).ravel()
+        if len(color) == 4:
+            alpha = color[-1]
+            color = color[0:-1]
+        coltuple = color
+    elif isinstance(color, str) and (color[0] != '#'):  # Matplotlib
+        # Check if the name is in the Matplotlib database :
+        if color in mplcol.cnames.keys():
+            coltuple = mplcol.hex2color(mplcol.cnames[color])
+        else:
+            warn("The color name " + color + " is not in the matplotlib "
+                 "database. Default color will be used instead.")
+            coltuple = default
+    elif isinstance(color, str) and (color[0] == '#'):  # Hexadecimal
+        try:
+            coltuple = mplcol.hex2color(color)
+        except:
+            warn("The hexadecimal color " + color + " is not valid. "
+                 "Default color will be used instead.")
+            coltuple = default
+    return coltuple, alpha
+
+
 def color2vb(color=None, default=(1., 1., 1.), length=1, alpha=1.0,
              faces_index=False):
     """Turn into a RGBA compatible color format.
@@ -211,29 +247,7 @@ def color2vb(color=None, default=(1., 1., 1.), length=1, alpha=1.0,
     """
     # Default or static color :
     if (color is None) or isinstance(color, (str, tuple, list, np.ndarray)):
-        if color is None:  # Default
-            coltuple = default
-        elif isinstance(color, (tuple, list, np.ndarray)):  # Static
-            color = np.squeeze(color).ravel()
-            if len(color) == 4:
-                alpha = color[-1]
-                color = color[0:-1]
-            coltuple = color
-        elif isinstance(color, str) and (color[0] is not '#'):  # Matplotlib
-            # Check if the name is in the Matplotlib database :
-            if color in mplcol.cnames.keys():
-                coltuple = mplcol.hex2color(mplcol.cnames[color])
-            else:
-                warn("The color name " + color + " is not in the matplotlib "
-                     "database. Default color will be used instead.")
-                coltuple = default
-        elif isinstance(color, str) and (color[0] is '#'):  # Hexadecimal
-            try:
-                coltuple = mplcol.hex2color(color)
-            except:
-                warn("The hexadecimal color " + color + " is not valid. "
-                     "Default color will be used instead.")
-                coltuple = default
+        coltuple, alpha = _color2rgb(color, default, alpha)
         # Set the color :
         vcolor = np.concatenate((np.array([list(coltuple)] * length),
                                  alpha * np.ones((length, 1),
@@ -494,9 +508,9 @@ def colorclip(x, th, kind='under'):
     x : array_like
         The clipping array.
     """
-    if kind is 'under':
+    if kind == 'under':
         idx = x < th
-    elif kind is 'over':
+    elif kind == 'over':
         idx = x > th
     x[idx] = th
     return x
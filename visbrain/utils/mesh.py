@@ -4,7 +4,6 @@ import logging
 import numpy as np
 from scipy.spatial.distance import cdist
 
-from vispy.geometry import MeshData
 from vispy.geometry.isosurface import isosurface
 
 from .sigproc import smooth_3d
@@ -39,6 +38,105 @@ def vispy_array(data, dtype=np.float32):
     return data
 
 
+def _vertex_normals(vertices, faces):
+    """Compute the normal of each vertex.
+
+    The normal of a vertex is the sum of the normals of its faces, weighted
+    by the area of the faces.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Vertices of shape (N, 3).
+    faces : array_like
+        Faces of shape (M, 3).
+
+    Returns
+    -------
+    normals : array_like
+        The normalized normals of shape (N, 3).
+    """
+    tri = vertices[faces]
+    face_normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    # Sum normals of faces sharing a vertex (one bincount per coordinate) :
+    faces = faces.ravel()
+    normals = np.empty((len(vertices), 3), dtype=face_normals.dtype)
+    for k in range(3):
+        normals[:, k] = np.bincount(faces, np.repeat(face_normals[:, k], 3),
+                                    minlength=len(vertices))
+    norms = np.sqrt((normals ** 2).sum(1))
+    nonzero = norms > 0
+    normals[nonzero] /= norms[nonzero][:, np.newaxis]
+    return normals
+
+
+def _faces_locality_order(vertices, faces):
+    """Get an order of the faces that improves the GPU vertex cache usage.
+
+    Faces are sorted along a Z-order (Morton) curve of their centers so that
+    consecutive triangles are spatially close and tend to share vertices.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Vertices of shape (N, 3).
+    faces : array_like
+        Faces of shape (M, 3).
+
+    Returns
+    -------
+    order : array_like
+        Permutation of the faces of shape (M,).
+    """
+    centers = vertices[faces].mean(1)
+    c_min, c_max = centers.min(0), centers.max(0)
+    scale = 1023. / np.maximum(c_max - c_min, np.finfo(np.float32).eps)
+    # Quantize centers on 10 bits per axis and interleave the bits :
+    q = ((centers - c_min) * scale).astype(np.uint64)
+    for shift, mask in ((16, 0x030000FF), (8, 0x0300F00F), (4, 0x030C30C3),
+                        (2, 0x09249249)):
+        q = (q | (q << np.uint64(shift))) & np.uint64(mask)
+    code = q[:, 0] | (q[:, 1] << np.uint64(1)) | (q[:, 2] << np.uint64(2))
+    return np.argsort(code, kind='mergesort')
+
+
+def _vertex_clustering(vertices, faces, n_cells):
+    """Decimate a mesh by merging the vertices falling in the same grid cell.
+
+    Each vertex is replaced by a representative vertex of its cell, hence the
+    decimated faces still index the original vertices.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Vertices of shape (N, 3).
+    faces : array_like
+        Faces of shape (M, 3).
+    n_cells : int
+        Number of grid cells along the largest dimension of the mesh.
+
+    Returns
+    -------
+    faces : array_like
+        Decimated faces of shape (P, 3), with P <= M.
+    """
+    v_min = vertices.min(0)
+    size = (vertices.max(0) - v_min).max() / n_cells
+    cells = np.floor((vertices - v_min) / size).astype(np.int64)
+    keys = (cells[:, 0] * (n_cells + 1) + cells[:, 1]) * (n_cells + 1) + \
+        cells[:, 2]
+    _, first, inverse = np.unique(keys, return_index=True,
+                                  return_inverse=True)
+    new_faces = first[inverse.ravel()][faces]
+    # Remove degenerated and duplicated faces :
+    is_tri = (new_faces[:, 0] != new_faces[:, 1]) & (
+        new_faces[:, 1] != new_faces[:, 2]) & (
+        new_faces[:, 0] != new_faces[:, 2])
+    new_faces = new_faces[is_tri]
+    _, idx = np.unique(np.sort(new_faces, 1), axis=0, return_index=True)
+    return new_faces[np.sort(idx)].astype(faces.dtype, copy=False)
+
+
 def convert_meshdata(vertices=None, faces=None, normals=None, meshdata=None,
                      invert_normals=False, transform=None):
     """Convert mesh data to be compatible with visbrain.
@@ -80,8 +178,7 @@ def convert_meshdata(vertices=None, faces=None, normals=None, meshdata=None,
             faces -= faces.min()
         # Get normals if None :
         if (normals is None) or (normals.ndim != 2):
-            md = MeshData(vertices=vertices, faces=faces)
-            normals = md.get_vertex_normals()
+            normals = _vertex_normals(vertices, faces)
             logger.debug('Indexed faces normals converted // extracted')
     assert vertices.ndim == 2
 
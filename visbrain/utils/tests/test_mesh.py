@@ -3,7 +3,8 @@ import numpy as np
 
 from visbrain.utils.mesh import (convert_meshdata, vispy_array, volume_to_mesh,
                                  mesh_edges, smoothing_matrix,
-                                 laplacian_smoothing)
+                                 laplacian_smoothing, _vertex_normals,
+                                 _faces_locality_order, _vertex_clustering)
 
 
 class TestMesh(object):
@@ -51,6 +52,33 @@ class TestMesh(object):
         tr.rotate(90, (0, 0, 1))
         convert_meshdata(*tup, transform=tr)[-1]
 
+    def test_vertex_normals(self):
+        """Test function _vertex_normals."""
+        from vispy.geometry import create_sphere
+        md = create_sphere(20, 20)
+        vertices, faces = md.get_vertices(), md.get_faces()
+        normals = _vertex_normals(vertices, faces)
+        np.testing.assert_allclose(normals, md.get_vertex_normals(),
+                                   atol=1e-6)
+
+    def test_faces_locality_order(self):
+        """Test function _faces_locality_order."""
+        from vispy.geometry import create_sphere
+        md = create_sphere(20, 20)
+        faces = md.get_faces()
+        order = _faces_locality_order(md.get_vertices(), faces)
+        assert np.array_equal(np.sort(order), np.arange(len(faces)))
+
+    def test_vertex_clustering(self):
+        """Test function _vertex_clustering."""
+        from vispy.geometry import create_sphere
+        md = create_sphere(40, 40)
+        faces = md.get_faces()
+        dec = _vertex_clustering(md.get_vertices(), faces, 8)
+        assert 0 < len(dec) < len(faces)
+        assert dec.dtype == faces.dtype
+        assert np.all(dec[:, [0, 1, 2]] != dec[:, [1, 2, 0]])
+
     def test_volume_to_mesh(self):
         """Test function volume_to_mesh."""
         x = np.random.rand(10, 20, 30)
@@ -9,10 +9,13 @@ which make it easier to add vispy transformations.
 
 Authors: Etienne Combrisson <e.combrisson@gmail.com>
 
-Textures
---------
-1D texture : white (0) + sulcus (.5) + mask (1.)
-2D texture : overlays (limited to 4 overlays)
+Colors
+------
+Background : white (0) + mask (1) + sulcus (2), stored as uint8 indices
+Overlays : one LUT per overlay (limited to MAX_OVERLAYS=4 overlays)
+
+The final color of each vertex only depends on the background and overlays
+so it is composed once (CPU side) and sent as a single vertex buffer.
 
 License: BSD (3-clause)
 """
@@ -21,22 +24,30 @@ import logging
 
 from vispy import gloo
 from vispy.visuals import Visual
-import vispy.visuals.transforms as vist
+from vispy.visuals.shaders import Function
 from vispy.scene.visuals import create_visual_node
 
 from visbrain.utils import (Colormap, color2vb, convert_meshdata,
-                            wrap_properties, normalize)
+                            wrap_properties)
+from visbrain.utils.mesh import _faces_locality_order, _vertex_clustering
 
 
 logger = logging.getLogger('visbrain')
 
 # Light and color properties :
 LUT_LEN = 1024
+MAX_OVERLAYS = 4
 LIGHT_POSITION = [0., 0., 1e7]
 LIGHT_INTENSITY = [1.] * 3
 COEF_AMBIENT = .05
 COEF_SPECULAR = 0.1
+SHININESS = 32.
 SULCUS_COLOR = [.4] * 3 + [1.]
+# Level of details (each level has roughly four times less faces). It is
+# disabled by default (full resolution mesh) :
+LOD_LEVELS = 2
+LOD_MIN_FACES = 10000
+LOD_BIAS = np.inf
 
 # Vertex shader : executed code for individual vertices. The transformation
 # applied to each one of them is the camera rotation.
@@ -50,27 +61,11 @@ void main() {
     v_position = $a_position;
     v_normal = $u_inv_light * $a_normal;
 
-    // Compute background color (i.e white / mask / sulcus)
-    vec4 bg_color = texture1D($u_bgd_text, $a_bgd_data);
-
-    // Compute overlay colors :
-    vec4 overlay_color = vec4(0., 0., 0., 0.);
-    float u_div = 0.;
-    float off = float($u_n_overlays > 1) * 0.999999;
-    for (int i=0; i<$u_n_overlays; i++) {
-        // Texture coordinate :
-        vec2 tex_coords = vec2($u_range[i], (i + off)/$u_n_overlays);
-        // Get the color using the texture :
-        vec4 ux = texture2D($u_over_text, tex_coords);
-        // Ponderate the color with transparency level :
-        overlay_color += $u_alphas[i] * ux;
-        // Number of contributing overlay per vertex :
-        u_div += $u_alphas[i];
-    }
-    overlay_color /= max(u_div, 1.);
+    // Background and overlays colors (see BrainVisual._update_color) :
+    v_color = $a_color;
 
-    // Mix background and overlay colors :
-    v_color = mix(bg_color, overlay_color, overlay_color.a);
+    // Light per vertex (vertex shading only) :
+    v_color = $vert_light(v_color, v_position, v_normal);
 
     // Finally apply camera transform to position :
     gl_Position = $transform(vec4($a_position, 1));
@@ -80,10 +75,6 @@ void main() {
 
 # Fragment shader : executed code to each Fragment generated by the
 # Rasterization and turn it into a set of colors and a single depth value.
-# The code bellow generate three types of light :
-# * Ambient : uniform light across fragments
-# * Diffuse : ajust light according to normal vector
-# * Specular : add some high-density light for a "pop / shiny" effect.
 FRAG_SHADER = """
 #version 120
 varying vec3 v_position;
@@ -102,35 +93,57 @@ void main() {
         discard;
     }
 
-    // Adapt light position with camera rotation
-    vec3 light_pos = $camtf(vec4($u_light_position, 0.)).xyz;
+    // Light per fragment (fragment shading only) :
+    vec4 color = $frag_light(v_color, v_position, v_normal);
+
+    // ----------------- Gamma correction -----------------
+    // vec3 gamma = vec3(1.0/1.2);
+
+    // ----------------- Final color -----------------
+    // Without gamma correction :
+    gl_FragColor = vec4(color.rgb, $u_alpha);
+
+    // With gamma correction :
+    // gl_FragColor = vec4(pow(color.rgb, gamma), $u_alpha);
+}
+"""
+
+
+# Light function : hooked either to the vertex shader (vertex shading, light
+# interpolated across fragments) or to the fragment shader (fragment shading,
+# light computed per fragment). The code bellow generate three types of
+# light :
+# * Ambient : uniform light across fragments
+# * Diffuse : ajust light according to normal vector
+# * Specular : add some high-density light for a "pop / shiny" effect.
+LIGHT_FUNC = """
+vec4 lighting(vec4 color, vec3 position, vec3 normal) {
+    // Light position adapted to the camera rotation (see _prepare_draw)
+    vec3 light_pos = $u_light_position;
 
     // ----------------- Ambient light -----------------
-    vec3 ambientLight = $u_coef_ambient * v_color.rgb * $u_light_intensity;
+    vec3 ambientLight = $u_coef_ambient * color.rgb * $u_light_intensity;
 
     // ----------------- Diffuse light -----------------
     // Calculate the vector from this pixels surface to the light source
-    vec3 surfaceToLight = light_pos - v_position;
+    vec3 surfaceToLight = light_pos - position;
 
     // Calculate the cosine of the angle of incidence
-    float l_surf_norm = length(surfaceToLight) * length(v_normal);
-    float brightness = dot(v_normal, surfaceToLight) / l_surf_norm;
+    float l_surf_norm = length(surfaceToLight) * length(normal);
+    float brightness = dot(normal, surfaceToLight) / l_surf_norm;
     // brightness = clamp(brightness, 0, 1);
     brightness = max(min(brightness, 1.0), 0.0);
 
     // Get diffuse light :
-    vec3 diffuseLight =  v_color.rgb * brightness * $u_light_intensity;
+    vec3 diffuseLight =  color.rgb * brightness * $u_light_intensity;
 
     // ----------------- Specular light -----------------
-    vec3 lightDir = normalize(surfaceToLight);
-    vec3 viewDir = normalize(light_pos - v_position);
-    vec3 reflectDir = reflect(-lightDir, normalize(v_normal));
-    float specular = pow(max(dot(viewDir, reflectDir), 0.0), 32);
-    vec3 specularLight = $u_coef_specular * specular * vec3(1., 1., 1.);
+    vec3 specularLight = $specular(surfaceToLight, light_pos - position,
+                                   normal);
 
     // ----------------- Attenuation -----------------
     // float att = 0.0001;
-    // float distanceToLight = length(light_pos - v_position);
+    // float distanceToLight = length(light_pos - position);
     // float attenuation = 1.0 / (1.0 + att * pow(distanceToLight, 4));
 
     // ----------------- Linear color -----------------
@@ -141,18 +154,66 @@ void main() {
     // vec3 linearColor = attenuation*(specularLight + diffuseLight);
     // linearColor += ambientLight
 
-    // ----------------- Gamma correction -----------------
-    // vec3 gamma = vec3(1.0/1.2);
+    return vec4(linearColor, color.a);
+}
+"""
 
-    // ----------------- Final color -----------------
-    // Without gamma correction :
-    gl_FragColor = vec4(linearColor, $u_alpha);
+# Specular light function. Without specular light, the NO_SPECULAR_FUNC is
+# used so that the computations are removed from the compiled shader :
+SPECULAR_FUNC = """
+vec3 specular(vec3 surfaceToLight, vec3 surfaceToView, vec3 normal) {
+    vec3 lightDir = normalize(surfaceToLight);
+    vec3 viewDir = normalize(surfaceToView);
+    vec3 reflectDir = reflect(-lightDir, normalize(normal));
+    // Schlick's approximation of pow(d, shininess) :
+    float d = max(dot(viewDir, reflectDir), 0.0);
+    float specular = d / ($u_shininess - ($u_shininess - 1.) * d);
+    return $u_coef_specular * specular * vec3(1., 1., 1.);
+}
+"""
 
-    // With gamma correction :
-    // gl_FragColor = vec4(pow(linearColor, gamma), $u_alpha);
+NO_SPECULAR_FUNC = """
+vec3 no_specular(vec3 surfaceToLight, vec3 surfaceToView, vec3 normal) {
+    return vec3(0., 0., 0.);
 }
 """
 
+NO_LIGHT_FUNC = """
+vec4 no_lighting(vec4 color, vec3 position, vec3 normal) {
+    return color;
+}
+"""
+
+
+def _normalize_lut(data, data_lim, out):
+    """Normalize data between [0, 1] into a float32 array.
+
+    Parameters
+    ----------
+    data : array_like
+        Array of data of shape (n_data,).
+    data_lim : tuple
+        The (min, max) of the data.
+    out : array_like
+        Float32 array of shape (n_data,) where the normalized data are
+        written.
+    """
+    xm, xh = np.float32(data_lim[0]), np.float32(data_lim[1])
+    if xm != xh:
+        np.subtract(data, xh, out=out, casting='unsafe')
+        np.multiply(out, 1. / (xh - xm), out=out)
+        np.add(out, 1., out=out)
+    else:
+        np.divide(data, xh, out=out, casting='unsafe')
+    return out
+
+
+def _to_rgba8(rgba):
+    """Quantize RGBA colors between [0, 1] to premultiplied unsigned bytes."""
+    rgba = np.array(rgba, dtype=np.float64)
+    rgba[..., 0:3] *= rgba[..., 3:]
+    return np.round(rgba * 255.).astype(np.uint8)
+
 
 class BrainVisual(Visual):
     """Visual object for brain mesh.
@@ -181,23 +242,32 @@ class BrainVisual(Visual):
     lr_index : int | None
         Integer which specify the index where to split left and right
         hemisphere.
+    shading : {'vertex', 'fragment'}
+        Compute the light per vertex (faster) or per fragment (smoother).
+    lod_bias : float | np.inf
+        Level of details of large meshes. The drawn level is the coarsest
+        one with at least lod_bias faces per pixel covered by the mesh (e.g
+        1.). Decimated levels only keep one vertex per cluster, hence small
+        overlays can be lost. Use np.inf to always draw the full mesh.
     """
 
     def __len__(self):
         """Return the number of vertices."""
-        return self._vertices.shape[0]
+        return self._n_vert
 
     def __iter__(self):
-        """Iteration function."""
-        pass
+        """Iterate over the vertices."""
+        for k in self._vertices:
+            yield k
 
-    def __getitem__(self):
-        """Get a specific item."""
-        pass
+    def __getitem__(self, idx):
+        """Get vertices."""
+        return self._vertices[idx]
 
     def __init__(self, vertices=None, faces=None, normals=None, lr_index=None,
                  hemisphere='both', sulcus=None, alpha=1., mask_color='orange',
-                 camera=None, meshdata=None, invert_normals=False):
+                 camera=None, meshdata=None, invert_normals=False,
+                 shading='vertex', lod_bias=LOD_BIAS):
         """Init."""
         self._camera = None
         self._translucent = True
@@ -205,6 +275,9 @@ class BrainVisual(Visual):
         self._hemisphere = hemisphere
         self._n_overlay = 0
         self._data_lim = []
+        self._color_range = None
+        self._lod = 0
+        self._lod_bias = lod_bias
 
         # Initialize the vispy.Visual class with the vertex / fragment buffer :
         Visual.__init__(self, vcode=VERT_SHADER, fcode=FRAG_SHADER)
@@ -212,25 +285,32 @@ class BrainVisual(Visual):
         # _________________ BUFFERS _________________
         # Vertices / faces / normals / color :
         def_3 = np.zeros((0, 3), dtype=np.float32)
+        def_4 = np.zeros((0, 4), dtype=np.float32)
         self._vert_buffer = gloo.VertexBuffer(def_3)
         self._normals_buffer = gloo.VertexBuffer(def_3)
-        self._bgd_buffer = gloo.VertexBuffer()
-        self._xrange_buffer = gloo.VertexBuffer()
-        self._alphas_buffer = gloo.VertexBuffer()
+        self._color_buffer = gloo.VertexBuffer(def_4)
         self._index_buffer = gloo.IndexBuffer()
+        # Background colors (white / mask / sulcus) :
+        self._bgd_colors = np.array([[1.] * 4, [1.] * 4, SULCUS_COLOR],
+                                    dtype=np.float32)
 
         # _________________ PROGRAMS _________________
         self.shared_program.vert['a_position'] = self._vert_buffer
         self.shared_program.vert['a_normal'] = self._normals_buffer
-        self.shared_program.vert['u_n_overlays'] = self._n_overlay
+        self.shared_program.vert['a_color'] = self._color_buffer
         self.shared_program.frag['u_alpha'] = alpha
 
         # _________________ LIGHTS _________________
-        self.shared_program.frag['u_light_intensity'] = LIGHT_INTENSITY
-        self.shared_program.frag['u_coef_ambient'] = COEF_AMBIENT
-        self.shared_program.frag['u_coef_specular'] = COEF_SPECULAR
-        self.shared_program.frag['u_light_position'] = LIGHT_POSITION
-        self.shared_program.frag['camtf'] = vist.NullTransform()
+        self._light = Function(LIGHT_FUNC)
+        self._no_light = Function(NO_LIGHT_FUNC)
+        self._light['u_light_intensity'] = LIGHT_INTENSITY
+        self._light['u_coef_ambient'] = COEF_AMBIENT
+        self._specular = Function(SPECULAR_FUNC)
+        self._no_specular = Function(NO_SPECULAR_FUNC)
+        self._specular['u_shininess'] = SHININESS
+        self.coef_specular = COEF_SPECULAR
+        self._light_pos = None
+        self.shading = shading
 
         # _________________ DATA / CAMERA / LIGHT _________________
         # Data :
@@ -288,12 +368,12 @@ class BrainVisual(Visual):
         self._faces = faces
         self._normals = normals
         # Keep shapes :
-        self._shapes = np.zeros(1, dtype=[('vert', int), ('faces', int)])
-        self._shapes['vert'] = vertices.shape[0]
-        self._shapes['faces'] = faces.shape[0]
+        self._n_vert, self._n_faces = vertices.shape[0], faces.shape[0]
 
-        # Find ratio for the camera :
+        # Find ratio for the camera (bounds are also used by slices) :
         v_max, v_min = vertices.max(0), vertices.min(0)
+        self._v_min, self._v_max = v_min, v_max
+        self._bbox = np.array(np.meshgrid(*zip(v_min, v_max))).reshape(3, -1).T
         cam_center = (v_max + v_min).astype(float) / 2.
         cam_scale_factor = (v_max - v_min).astype(float)
         self._opt_cam_state = dict(center=cam_center,
@@ -305,50 +385,55 @@ class BrainVisual(Visual):
             logger.debug('Left/Right hemispheres inferred from verices')
             lr_index = vertices[:, 0] <= vertices[:, 0].mean()
         self._lr_index = lr_index.astype(bool)
+        # A face belongs to an hemisphere if its three vertices do. Indices
+        # sent to the GPU are reordered for the vertex cache and stored on 16
+        # bits whenever possible :
+        idx_dtype = np.uint16 if self._n_vert <= 65536 else np.uint32
+        idx = faces[_faces_locality_order(vertices, faces)]
+        idx = idx.astype(idx_dtype, copy=False)
+        # Decimated levels are only built when first used (see _build_lod) :
+        self._hemi_faces = dict(both=[], left=[], right=[])
+        self._add_lod(idx)
+        self._lod, self._lod_built = 0, False
 
         # ____________________ BUFFERS ____________________
-        # Vertices // faces // normals :
-        self._vert_buffer.set_data(vertices, convert=True)
-        self._normals_buffer.set_data(normals, convert=True)
+        # Vertices // faces // normals (already float32 contiguous arrays) :
+        self._vert_buffer.set_data(vertices, convert=False)
+        self._normals_buffer.set_data(normals, convert=False)
         self.hemisphere = hemisphere
         # Sulcus :
-        n = len(self)
+        n = self._n_vert
         sulcus = np.zeros((n,), dtype=bool) if sulcus is None else sulcus
         assert isinstance(sulcus, np.ndarray)
         assert len(sulcus) == n and sulcus.dtype == bool
 
-        # ____________________ TEXTURES ____________________
-        # Background texture :
-        self._bgd_data = np.zeros((n,), dtype=np.float32)
-        self._bgd_data[sulcus] = .9
-        self._bgd_buffer.set_data(self._bgd_data, convert=True)
-        self.shared_program.vert['a_bgd_data'] = self._bgd_buffer
-        # Overlay texture :
-        self._text2d_data = np.zeros((2, LUT_LEN, 4), dtype=np.float32)
-        self._text2d = gloo.Texture2D(self._text2d_data)
-        self.shared_program.vert['u_over_text'] = self._text2d
-        # Build texture range :
-        self._xrange = np.zeros((n, 2), dtype=np.float32)
-        self._xrange_buffer.set_data(self._xrange)
-        self.shared_program.vert['u_range'] = self._xrange_buffer
-        # Define buffer for transparency per overlay :
-        self._alphas = np.zeros((n, 2), dtype=np.float32)
-        self._alphas_buffer.set_data(self._alphas)
-        self.shared_program.vert['u_alphas'] = self._alphas_buffer
+        # ____________________ COLORS ____________________
+        # Background (white / mask / sulcus) :
+        self._bgd_data = np.zeros((n,), dtype=np.uint8)
+        self._bgd_data[sulcus] = 2
+        # Overlays LUT :
+        n_ov = MAX_OVERLAYS
+        self._text2d_data = np.zeros((n_ov, LUT_LEN, 4), dtype=np.uint8)
+        # LUT range and transparency of each overlay, interleaved per vertex
+        # as (r0, a0, r1, a1, ...) :
+        self._ra = np.zeros((n, 2 * n_ov), dtype=np.float32)
+        self._color_range = None
+        self._update_color_range()
 
     def add_overlay(self, data, vertices=None, to_overlay=None, mask_data=None,
                     **kwargs):
         """Add an overlay to the mesh.
 
-        Note that the current implementation limit to a number of of four
-        overlays.
+        Note that the current implementation limit to a number of
+        MAX_OVERLAYS=4 overlays (stored in preallocated arrays).
 
         Parameters
         ----------
         data : array_like
             Array of data of shape (n_data,).
         vertices : array_like | None
-            The vertices to color with the data of shape (n_data,).
+            The vertices to color with the data of shape (n_data,) or a
+            boolean mask of shape (n_vertices,).
         to_overlay : int | None
             Add data to a specific overlay. This parameter must be a integer.
         mask_data : array_like | None
@@ -358,67 +443,70 @@ class BrainVisual(Visual):
             Additional color color properties (cmap, clim, vmin, vmax, under,
             over, translucent)
         """
-        # Check input variables :
-        if vertices is None:
-            vertices = np.ones((len(self),), dtype=bool)
         # Send data to the mask :
-        if isinstance(mask_data, np.ndarray) and len(mask_data) == len(self):
-            self._bgd_data[mask_data] = .5
-            self._bgd_buffer.set_data(self._bgd_data)
-        if not len(vertices):
-            logger.warning('Vertices array is empty. Abandoning.')
-            return
+        n = self._n_vert
+        if isinstance(mask_data, np.ndarray) and len(mask_data) == n:
+            self._bgd_data[mask_data] = 1
+            self._update_color_range(mask_data)
+        # Check input variables :
+        if vertices is None:  # every vertex (written inplace)
+            vertices = slice(None)
+        else:
+            # Sparse writes only touch the selected vertices :
+            vertices = np.asarray(vertices)
+            if vertices.dtype == bool:
+                vertices = np.flatnonzero(vertices)
+            if not vertices.size:
+                logger.warning('Vertices array is empty. Abandoning.')
+                return
 
         data = np.asarray(data)
         to_overlay = self._n_overlay if to_overlay is None else to_overlay
+        if to_overlay >= MAX_OVERLAYS:
+            raise ValueError("The number of overlays is limited to %i" %
+                             MAX_OVERLAYS)
         data_lim = (data.min(), data.max())
         if len(self._data_lim) < to_overlay + 1:
             self._data_lim.append(data_lim)
         else:
             self._data_lim[to_overlay] = data_lim
         # -------------------------------------------------------------
-        # TEXTURE COORDINATES
+        # LUT COORDINATES
         # -------------------------------------------------------------
-        need_reshape = to_overlay >= self._xrange.shape[1]
-        if need_reshape:
-            # Add column of zeros :
-            z_ = np.zeros((len(self),), dtype=np.float32)
-            z_text = np.zeros((1, LUT_LEN, 4), dtype=np.float32)
-            self._xrange = np.c_[self._xrange, z_]
-            self._alphas = np.c_[self._alphas, z_]
-            self._text2d_data = np.concatenate((self._text2d_data, z_text))
-        # (x, y) coordinates of the overlay for the texture :
-        self._xrange[vertices, to_overlay] = normalize(data)
+        # Position of the data in the LUT of the overlay. The normalized
+        # data are directly written into the range when every vertex is
+        # used :
+        if isinstance(vertices, slice):
+            xrange = self._ra[vertices, 2 * to_overlay]
+        else:
+            xrange = np.empty(data.shape, dtype=np.float32)
+        _normalize_lut(data, data_lim, xrange)
+        if not isinstance(vertices, slice):
+            self._ra[vertices, 2 * to_overlay] = xrange
         # Transparency :
-        self._alphas[vertices, to_overlay] = 1.  # transparency level
+        self._ra[vertices, 2 * to_overlay + 1] = 1.  # transparency level
 
         # -------------------------------------------------------------
-        # TEXTURE COLOR
+        # LUT COLOR
         # -------------------------------------------------------------
         # Colormap interpolation (if needed):
         colormap = Colormap(**kwargs)
         vec = np.linspace(data_lim[0], data_lim[1], LUT_LEN)
-        self._text2d_data[to_overlay, ...] = colormap.to_rgba(vec)
+        self._text2d_data[to_overlay, ...] = _to_rgba8(colormap.to_rgba(vec))
 
-        # -------------------------------------------------------------
-        # BUFFERS
-        # -------------------------------------------------------------
-        if need_reshape:
-            # Re-define buffers :
-            self._xrange_buffer = gloo.VertexBuffer(self._xrange)
-            self._text2d = gloo.Texture2D(self._text2d_data)
-            self._alphas_buffer = gloo.VertexBuffer(self._alphas)
-            # Send buffers to vertex shader :
-            self.shared_program.vert['u_range'] = self._xrange_buffer
-            self.shared_program.vert['u_alphas'] = self._alphas_buffer
-            self.shared_program.vert['u_over_text'] = self._text2d
-        else:
-            self._xrange_buffer.set_data(self._xrange)
-            self._text2d.set_data(self._text2d_data)
-            self._alphas_buffer.set_data(self._alphas)
         # Update the number of overlays :
+        is_new = to_overlay >= self._n_overlay
+        if to_overlay + 1 < self._n_overlay:  # overlays are dropped
+            self._ra[:, 2 * (to_overlay + 1):] = 0.
+            self._update_color_range()
         self._n_overlay = to_overlay + 1
-        self.shared_program.vert['u_n_overlays'] = self._n_overlay
+        # Vertices colored by this overlay (i.e previous and new data) :
+        if not is_new:
+            self._update_color_range(self._ra[:, 2 * to_overlay + 1] > 0.)
+        elif isinstance(vertices, slice):
+            self._update_color_range()
+        else:
+            self._update_color_range(vertices)
 
     def update_colormap(self, to_overlay=None, **kwargs):
         """Update colormap properties of an overlay.
@@ -437,8 +525,9 @@ class BrainVisual(Visual):
             # Define the colormap data :
             data_lim = self._data_lim[overlay]
             col = np.linspace(data_lim[0], data_lim[1], LUT_LEN)
-            self._text2d_data[overlay, ...] = Colormap(**kwargs).to_rgba(col)
-            self._text2d.set_data(self._text2d_data)
+            rgba = Colormap(**kwargs).to_rgba(col)
+            self._text2d_data[overlay, ...] = _to_rgba8(rgba)
+            self._update_color_range()
             self.update()
 
     def set_camera(self, camera=None):
@@ -453,9 +542,17 @@ class BrainVisual(Visual):
             Set a camera to the Mesh for light adaptation
         """
         if camera is not None:
+            if self._camera is not None:
+                self._camera.transform.changed.disconnect(
+                    self._on_camera_changed)
             self._camera = camera
-            self.shared_program.frag['camtf'] = self._camera.transform
-            self.update()
+            self._camera.transform.changed.connect(self._on_camera_changed)
+            self._on_camera_changed()
+
+    def _on_camera_changed(self, event=None):
+        """Invalidate the light position when the camera moves."""
+        self._light_pos = None
+        self.update()
 
     def clean(self):
         """Clean the mesh.
@@ -466,14 +563,69 @@ class BrainVisual(Visual):
         self._vert_buffer.delete()
         self._index_buffer.delete()
         self._normals_buffer.delete()
-        self._xrange_buffer.delete()
-        self._math_buffer.delete()
+        self._color_buffer.delete()
+
+    def _build_bgd_colors(self):
+        """Update the mask color and invalidate masked vertices only."""
+        self._bgd_colors[1, :] = self.mask_color
+        self._update_color_range(self._bgd_data == 1)
+
+    def _update_color_range(self, vertices=None):
+        """Extend the range of vertices whose color has to be updated.
 
-    def _build_bgd_texture(self):
-        color_1d = np.c_[np.array([1.] * 4), np.array(self.mask_color),
-                         np.array(SULCUS_COLOR)].T
-        text_1d = gloo.Texture1D(color_1d.astype(np.float32))
-        self.shared_program.vert['u_bgd_text'] = text_1d
+        Parameters
+        ----------
+        vertices : array_like | None
+            Boolean mask or indices of the modified vertices. If None, the
+            color of every vertex is updated.
+        """
+        n = self._n_vert
+        if vertices is None:
+            lo, hi = 0, n
+        else:
+            vertices = np.asarray(vertices)
+            if vertices.dtype == bool:
+                vertices = np.flatnonzero(vertices)
+            if not vertices.size:
+                return
+            lo, hi = int(vertices.min()), int(vertices.max()) + 1
+        if self._color_range is not None:
+            lo = min(lo, self._color_range[0])
+            hi = max(hi, self._color_range[1])
+        self._color_range = (lo, hi)
+
+    def _update_color(self):
+        """Compose the color of modified vertices and send it to the GPU.
+
+        The background color is mixed with the mean color of the overlays
+        covering the vertex. Only the contiguous range of modified vertices
+        is sent to the GPU.
+        """
+        lo, hi = self._color_range
+        sl = slice(lo, hi)
+        # Background color (i.e white / mask / sulcus) :
+        color = self._bgd_colors[self._bgd_data[sl]]
+        n_ov = self._n_overlay
+        if n_ov:
+            # Premultiplied overlay colors (nearest color in the LUT of each
+            # overlay) :
+            ra = self._ra[sl, :2 * n_ov]
+            alphas = ra[:, 1::2]
+            lut_idx = (ra[:, 0::2] * LUT_LEN).astype(np.int32)
+            np.clip(lut_idx, 0, LUT_LEN - 1, out=lut_idx)
+            overlay = self._text2d_data[np.arange(n_ov), lut_idx]
+            overlay = np.einsum('ij,ijk->ik', alphas, overlay,
+                                dtype=np.float32)
+            # Number of contributing overlay per vertex (and LUT scaling) :
+            overlay /= 255. * np.maximum(alphas.sum(1, keepdims=True), 1.)
+            # Blend overlay colors over the background :
+            color *= 1. - overlay[:, [3]]
+            color += overlay
+        if (lo, hi) == (0, self._n_vert):
+            self._color_buffer.set_data(color)
+        else:
+            self._color_buffer.set_subdata(color, offset=lo)
+        self._color_range = None
 
     # =======================================================================
     # =======================================================================
@@ -487,7 +639,60 @@ class BrainVisual(Visual):
 
     def _prepare_draw(self, view=None):
         """Call everytime there is an interaction with the mesh."""
-        pass
+        if self._color_range is not None:
+            self._update_color()
+        if self._light_pos is None:
+            self._update_light_position()
+        if np.isfinite(self._lod_bias):
+            self._update_lod(view)
+
+    def _add_lod(self, idx):
+        """Add a level of details, split by hemisphere."""
+        lr_faces = self._lr_index[idx]
+        self._hemi_faces['both'].append(idx)
+        self._hemi_faces['left'].append(idx[lr_faces.all(1)])
+        self._hemi_faces['right'].append(idx[~lr_faces.any(1)])
+
+    def _build_lod(self):
+        """Build the decimated levels of details of large meshes."""
+        idx = self._hemi_faces['both'][0]
+        for k in range(1, LOD_LEVELS + 1):
+            n_faces = self._n_faces / 4 ** k
+            if n_faces < LOD_MIN_FACES:
+                break
+            n_cells = int(np.sqrt(n_faces / 8.))
+            self._add_lod(_vertex_clustering(self._vertices, idx, n_cells))
+        self._lod_built = True
+
+    def _update_lod(self, view):
+        """Select the level of details from the projected mesh size."""
+        if not self._lod_built:
+            self._build_lod()
+        n_faces = [len(k) for k in self._hemi_faces[self._hemisphere]]
+        if len(n_faces) == 1:
+            return
+        tr = view.transforms.get_transform('visual', 'canvas')
+        pos = tr.map(self._bbox)
+        area = np.prod(np.ptp(pos[:, 0:2] / pos[:, 3:4], axis=0))
+        lod = [k for k, n in enumerate(n_faces) if n >= self._lod_bias * area]
+        self._set_lod(max(lod) if lod else 0)
+
+    def _set_lod(self, lod):
+        """Send the faces of a level of details to the GPU."""
+        if lod != self._lod:
+            n_faces = len(self._hemi_faces[self._hemisphere][lod])
+            logger.debug("Level of details %i (%i faces)" % (lod, n_faces))
+            self._lod = lod
+            self._index_buffer.set_data(self._hemi_faces[self._hemisphere][
+                lod], convert=False)
+
+    def _update_light_position(self):
+        """Map the light position through the camera transformation."""
+        light_pos = np.r_[LIGHT_POSITION, 0.]
+        if self._camera is not None:
+            light_pos = self._camera.transform.map(light_pos)
+        self._light_pos = np.asarray(light_pos[0:3], dtype=np.float32)
+        self._light['u_light_position'] = self._light_pos
 
     @staticmethod
     def _prepare_transforms(view):
@@ -514,16 +719,65 @@ class BrainVisual(Visual):
     def hemisphere(self, value):
         """Set hemisphere value."""
         assert value in ['left', 'both', 'right']
-        if value == 'both':
-            index = self._faces
-        elif value == 'left':
-            index = self._faces[self._lr_index[self._faces[:, 0]], :]
-        elif value == 'right':
-            index = self._faces[~self._lr_index[self._faces[:, 0]], :]
-        self._index_buffer.set_data(index)
+        self._index_buffer.set_data(self._hemi_faces[value][self._lod],
+                                    convert=False)
         self.update()
         self._hemisphere = value
 
+    # ----------- LOD_BIAS -----------
+    @property
+    def lod_bias(self):
+        """Get the lod_bias value."""
+        return self._lod_bias
+
+    @lod_bias.setter
+    def lod_bias(self, value):
+        """Set lod_bias value.
+
+        The drawn level of details is the coarsest one with at least lod_bias
+        faces per pixel covered by the mesh bounding box. Use np.inf (default)
+        to always draw the full resolution mesh.
+        """
+        assert isinstance(value, (int, float)) and value > 0.
+        self._lod_bias = value
+        if not np.isfinite(value):  # back to the full resolution mesh
+            self._set_lod(0)
+        self.update()
+
+    # ----------- SHADING -----------
+    @property
+    def shading(self):
+        """Get the shading value."""
+        return self._shading
+
+    @shading.setter
+    def shading(self, value):
+        """Set shading value."""
+        assert value in ['vertex', 'fragment']
+        vert_light = self._light if value == 'vertex' else self._no_light
+        frag_light = self._no_light if value == 'vertex' else self._light
+        self.shared_program.vert['vert_light'] = vert_light
+        self.shared_program.frag['frag_light'] = frag_light
+        self._shading = value
+        self.update()
+
+    # ----------- COEF_SPECULAR -----------
+    @property
+    def coef_specular(self):
+        """Get the coef_specular value."""
+        return self._coef_specular
+
+    @coef_specular.setter
+    def coef_specular(self, value):
+        """Set coef_specular value."""
+        assert isinstance(value, (int, float)) and value >= 0.
+        self._specular['u_coef_specular'] = value
+        # The shader is only rebuilt when the specular light is turned on/off :
+        specular = self._specular if value > 0. else self._no_specular
+        self._light['specular'] = specular
+        self._coef_specular = value
+        self.update()
+
     # ----------- SULCUS -----------
     @property
     def sulcus(self):
@@ -535,9 +789,9 @@ class BrainVisual(Visual):
     def sulcus(self, value):
         """Set sulcus value."""
         assert isinstance(value, np.ndarray) and len(value) == len(self)
-        assert isinstance(value.dtype, bool)
-        self._bgd_data[value] = 1.
-        self._bgd_buffer.set_data(self._bgd_data)
+        assert value.dtype == bool
+        self._bgd_data[value] = 2
+        self._update_color_range(value)
         self.update()
 
     # ----------- TRANSPARENT -----------
@@ -589,7 +843,7 @@ class BrainVisual(Visual):
         """Set mask_color value."""
         value = color2vb(value).ravel()
         self._mask_color = value
-        self._build_bgd_texture()
+        self._build_bgd_colors()
 
     @property
     def minmax(self):
@@ -605,7 +859,7 @@ class BrainVisual(Visual):
     @xmin.setter
     def xmin(self, value):
         """Set xmin value."""
-        value = self._vertices[:, 0].min() - 1 if value is None else value
+        value = float(self._v_min[0]) - 1 if value is None else value
         assert isinstance(value, (int, float))
         self.shared_program.frag['u_xmin'] = value
         self._xmin = value
@@ -619,7 +873,7 @@ class BrainVisual(Visual):
     @xmax.setter
     def xmax(self, value):
         """Set xmax value."""
-        value = self._vertices[:, 0].max() + 1 if value is None else value
+        value = float(self._v_max[0]) + 1 if value is None else value
         assert isinstance(value, (int, float))
         self.shared_program.frag['u_xmax'] = value
         self._xmax = value
@@ -633,7 +887,7 @@ class BrainVisual(Visual):
     @ymin.setter
     def ymin(self, value):
         """Set ymin value."""
-        value = self._vertices[:, 1].min() - 1 if value is None else value
+        value = float(self._v_min[1]) - 1 if value is None else value
         assert isinstance(value, (int, float))
         self.shared_program.frag['u_ymin'] = value
         self._ymin = value
@@ -647,7 +901,7 @@ class BrainVisual(Visual):
     @ymax.setter
     def ymax(self, value):
         """Set ymax value."""
-        value = self._vertices[:, 1].max() + 1 if value is None else value
+        value = float(self._v_max[1]) + 1 if value is None else value
         assert isinstance(value, (int, float))
         self.shared_program.frag['u_ymax'] = value
         self._ymax = value
@@ -661,7 +915,7 @@ class BrainVisual(Visual):
     @zmin.setter
     def zmin(self, value):
         """Set zmin value."""
-        value = self._vertices[:, 2].min() - 1 if value is None else value
+        value = float(self._v_min[2]) - 1 if value is None else value
         assert isinstance(value, (int, float))
         self.shared_program.frag['u_zmin'] = value
         self._zmin = value
@@ -675,7 +929,7 @@ class BrainVisual(Visual):
     @zmax.setter
     def zmax(self, value):
         """Set zmax value."""
-        value = self._vertices[:, 2].max() + 1 if value is None else value
+        value = float(self._v_max[2]) + 1 if value is None else value
         assert isinstance(value, (int, float))
         self.shared_program.frag['u_zmax'] = value
         self._zmax = value